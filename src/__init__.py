@@ -4,13 +4,18 @@ FFmpeg Audio - A Python library for streaming audio/video files using FFmpeg.
 This package provides utilities for:
 - Streaming audio/video files in chunks
 - Reading specific time segments from audio files
+- Reading many segments of one file through a single FFmpeg process
 - Automatic resampling and channel mixing
 """
 
 import logging
+from typing import TYPE_CHECKING
 
 from .exceptions import FFmpegAudioError, FFmpegNotFoundError, UnsupportedFormatError
-from .ffmpeg_audio import FFmpegAudio
+
+if TYPE_CHECKING:
+    # Visible to type checkers and IDEs; at runtime these are imported lazily by __getattr__
+    from .ffmpeg_audio import FFmpegAudio, FFmpegAudioSession
 
 __version__ = "0.3.0"
 
@@ -22,7 +27,29 @@ logger.addHandler(logging.NullHandler())
 
 __all__ = [
     "FFmpegAudio",
+    "FFmpegAudioSession",
     "FFmpegNotFoundError",
     "FFmpegAudioError",
     "UnsupportedFormatError",
 ]
+
+
+def __getattr__(name: str):
+    """
+    Lazily import FFmpegAudio and FFmpegAudioSession on first access (PEP 562).
+
+    Importing the package only loads the exception classes; NumPy and the
+    subprocess machinery are loaded when one of the classes is first used.
+    """
+    if name in ("FFmpegAudio", "FFmpegAudioSession"):
+        from . import ffmpeg_audio
+
+        value = getattr(ffmpeg_audio, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List lazily imported attributes too, so dir() and tab completion show FFmpegAudio and FFmpegAudioSession"""
+    return sorted(set(globals()) | set(__all__))
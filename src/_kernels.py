@@ -0,0 +1,25 @@
+"""
+Numba-compiled PCM conversion kernels.
+
+This module is optional: importing it requires Numba. ffmpeg_audio imports it lazily
+on first use and falls back to NumPy when Numba is not installed.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def int16_to_float32(src, dst):
+    """Scale int16 PCM into a preallocated float32 array of the same length in a single pass"""
+    scale = np.float32(1.0 / 32768.0)
+    for i in range(src.shape[0]):
+        dst[i] = src[i] * scale
+
+
+@njit(cache=True, fastmath=True, boundscheck=False, parallel=True)
+def int16_to_float32_parallel(src, dst):
+    """Same as int16_to_float32, with the loop split across all CPU cores (for large buffers)"""
+    scale = np.float32(1.0 / 32768.0)
+    for i in prange(src.shape[0]):
+        dst[i] = src[i] * scale
@@ -5,8 +5,15 @@ Provides a hierarchy of exceptions for different error conditions,
 enabling precise error handling and debugging.
 """
 
+import re
 from typing import Optional
 
+# Known FFmpeg stderr messages, matched case-insensitively in a single pass
+_NO_SUCH_FILE = "no such file or directory"
+_PERMISSION_DENIED = "permission denied"
+_INVALID_DATA = "invalid data found when processing input"
+_FFMPEG_ERROR_RE = re.compile("|".join(map(re.escape, (_NO_SUCH_FILE, _PERMISSION_DENIED, _INVALID_DATA))), re.IGNORECASE)
+
 
 class FFmpegNotFoundError(Exception):
     """
@@ -117,14 +124,15 @@ def parse_ffmpeg_error(
         - UnsupportedFormatError: Format not supported or corrupted
         - FFmpegAudioError: Other FFmpeg errors
     """
-    stderr_lower = stderr.lower()
+    # Collect known error patterns with one scan (no lowercased copy of stderr)
+    found = {match.lower() for match in _FFMPEG_ERROR_RE.findall(stderr)}
 
-    # Check for specific error patterns in stderr
-    if "no such file or directory" in stderr_lower:
+    # Check for specific error patterns in stderr, in priority order
+    if _NO_SUCH_FILE in found:
         return FileNotFoundError(f"Audio file not found: {file_path}")
-    elif "permission denied" in stderr_lower:
+    elif _PERMISSION_DENIED in found:
         return PermissionError(f"Permission denied accessing file: {file_path}")
-    elif "invalid data found when processing input" in stderr_lower:
+    elif _INVALID_DATA in found:
         return UnsupportedFormatError(
             f"Unsupported or invalid audio format: {file_path}",
             file_path=file_path,
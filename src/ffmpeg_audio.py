@@ -6,18 +6,36 @@ Supports both streaming (chunk-by-chunk) and one-time segment reading.
 All audio is automatically resampled to 16kHz and converted to mono channel.
 """
 
+import concurrent.futures
+import errno
+import functools
+import itertools
 import logging
 import os
+import queue
+import shutil
+import stat
+import struct
 import subprocess
-from typing import Iterator, Optional
+import threading
+from typing import Callable, Iterable, Iterator, List, Literal, Optional, Union
 
 import numpy as np
 
 from .exceptions import FFmpegAudioError, FFmpegNotFoundError, parse_ffmpeg_error
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Kernel pipe capacity requested for FFmpeg stdout (Linux only, default is 64KB)
+_PIPE_SIZE = 1 << 20
+
 
+@functools.lru_cache(maxsize=None)
 def _get_stream_chunk_duration_sec() -> int:
     """Get stream chunk duration from environment variable, compatible with non-standard values, defaults to 1200 seconds"""
     env_val = os.getenv("FFMPEG_STREAM_CHUNK_DURATION_SEC", "").strip()
@@ -30,6 +48,7 @@ def _get_stream_chunk_duration_sec() -> int:
         return 1200
 
 
+@functools.lru_cache(maxsize=None)
 def _get_default_timeout_ms() -> int:
     """Get default timeout from environment variable, compatible with non-standard values, defaults to 300000 milliseconds (5 minutes)"""
     env_val = os.getenv("FFMPEG_TIMEOUT_MS", "").strip()
@@ -42,9 +61,561 @@ def _get_default_timeout_ms() -> int:
         return 300000
 
 
-# Module-level constants (can be used in function parameter defaults)
-_STREAM_CHUNK_DURATION_SEC = _get_stream_chunk_duration_sec()
-_DEFAULT_TIMEOUT_MS = _get_default_timeout_ms()
+@functools.lru_cache(maxsize=None)
+def _get_numba_parallel() -> bool:
+    """Get whether the parallel Numba kernel is enabled from environment variable ("1", "true", "yes", "on"), defaults to False"""
+    return os.getenv("FFMPEG_NUMBA_PARALLEL", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+# Module-level overrides for the defaults above, read at call time
+# None means "use the environment variable"; assign a positive int to override at runtime
+_STREAM_CHUNK_DURATION_SEC: Optional[int] = None
+_DEFAULT_TIMEOUT_MS: Optional[int] = None
+
+
+def _stream_chunk_duration_sec() -> int:
+    """Get the effective default stream chunk duration: runtime override if set and valid, else environment (parsed once)"""
+    if _STREAM_CHUNK_DURATION_SEC is not None:
+        if _STREAM_CHUNK_DURATION_SEC > 0:
+            return _STREAM_CHUNK_DURATION_SEC
+        logger.warning("_STREAM_CHUNK_DURATION_SEC override is invalid (%s), ignoring it.", _STREAM_CHUNK_DURATION_SEC)
+    return _get_stream_chunk_duration_sec()
+
+
+def _default_timeout_ms() -> int:
+    """Get the effective default timeout: runtime override if set and valid, else environment (parsed once)"""
+    if _DEFAULT_TIMEOUT_MS is not None:
+        if _DEFAULT_TIMEOUT_MS > 0:
+            return _DEFAULT_TIMEOUT_MS
+        logger.warning("_DEFAULT_TIMEOUT_MS override is invalid (%sms), ignoring it.", _DEFAULT_TIMEOUT_MS)
+    return _get_default_timeout_ms()
+
+
+# Upper bound for the buffer read() preallocates from duration_ms (~35 minutes of s16 audio);
+# bytearray() zero-fills, so a far too long duration_ms for a short file must not cost more than this
+_MAX_PREALLOC_BYTES = 1 << 26
+
+# FFmpegAudioSession skips forward through decoded output up to this far; a longer jump
+# restarts FFmpeg with an input seek instead (decoding a minute of audio is cheaper than a restart)
+_SESSION_MAX_SKIP_SEC = 60
+
+# FFmpegAudio.read_async() converts results from this size on a worker thread instead of on the
+# event loop (~32s of s16 audio, the conversion then takes longer than the thread hand-off)
+_ASYNC_CONVERT_MIN_BYTES = 1 << 20
+
+# Number of PCM buffers cycling between the stream() reader thread and the consumer
+_PREFETCH_DEPTH = 2
+
+# Alignment of the stream() PCM buffers in bytes (one cache line, also enough for AVX-512 loads)
+_BUFFER_ALIGN = 64
+
+# Output representations accepted by FFmpegAudio.read() and FFmpegAudio.stream()
+_OUTPUT_DTYPES = ("float32", "int16", "bytes")
+_STREAM_OUTPUT_DTYPES = ("float32", "int16")
+
+# Resampler presets accepted by FFmpegAudio.stream() and FFmpegAudio.read()
+_RESAMPLERS = ("default", "fast", "soxr")
+
+# PCM sample format requested from FFmpeg for each precision: (FFmpeg -f value, NumPy dtype)
+_PRECISION_FORMATS = {
+    "s16": ("s16le", np.dtype(np.int16)),
+    "f32": ("f32le", np.dtype(np.float32)),
+    "u8": ("u8", np.dtype(np.uint8)),
+}
+
+# Scale factor mapping int16 [-32768, 32767] to float32 [-1.0, 1.0]
+# Kept as float32 so the multiply never promotes to float64
+_INV_32768 = np.float32(1.0 / 32768.0)
+
+# Lookup table mapping unsigned 8-bit PCM [0, 255] (silence at 128) to float32 [-1.0, 1.0)
+_U8_TO_F32 = (np.arange(256, dtype=np.float32) - np.float32(128.0)) / np.float32(128.0)
+
+# Below this many samples NumPy's per-call ufunc dispatch dominates the conversion,
+# so the optional Numba kernel is used instead (when installed)
+_NUMBA_MAX_SAMPLES = 16384
+
+# From this many samples (~65s of audio) the conversion is split across cores with the
+# parallel Numba kernel (when installed and enabled with FFMPEG_NUMBA_PARALLEL)
+_NUMBA_PARALLEL_MIN_SAMPLES = 1 << 20
+
+# Numba's default threading layer does not allow concurrent parallel launches from several threads
+_NUMBA_PARALLEL_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernels():
+    """Import the optional Numba kernels on first use, returns None if Numba is not installed"""
+    try:
+        from . import _kernels
+    except ImportError:
+        return None
+    return _kernels
+
+
+def _pcm16_to_float32(audio_int16: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Normalize int16 PCM to float32 in [-1.0, 1.0], using Numba for small inputs when available
+    (and for large ones when enabled with FFMPEG_NUMBA_PARALLEL).
+
+    Writes into out (float32, same length) if given, otherwise into a new array; returns the result.
+    """
+    n_samples = len(audio_int16)
+    kernels = None
+    if n_samples < _NUMBA_MAX_SAMPLES or (n_samples >= _NUMBA_PARALLEL_MIN_SAMPLES and _get_numba_parallel()):
+        kernels = _numba_kernels()
+
+    if kernels is None:
+        # Single ufunc pass: cast and scale are fused, no temporary array
+        return np.multiply(audio_int16, _INV_32768, out=out, dtype=np.float32)
+
+    if out is None:
+        out = np.empty(n_samples, dtype=np.float32)
+    if n_samples < _NUMBA_MAX_SAMPLES:
+        kernels.int16_to_float32(audio_int16, out)
+    else:
+        # The kernel already uses every core, so concurrent callers just take turns
+        with _NUMBA_PARALLEL_LOCK:
+            kernels.int16_to_float32_parallel(audio_int16, out)
+    return out
+
+
+def _pcm8_to_float32(audio_u8: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Normalize unsigned 8-bit PCM to float32 in [-1.0, 1.0) with a single table lookup.
+
+    Writes into out (float32, same length) if given, otherwise into a new array; returns the result.
+    """
+    return np.take(_U8_TO_F32, audio_u8, out=out)
+
+
+def _pcm_to_output(raw_buf: bytearray, output_dtype: str, pcm_dtype: np.dtype) -> Union[np.ndarray, bytes]:
+    """Turn a complete PCM buffer (read() result) into the requested output_dtype representation"""
+    # Raw PCM requested: skip NumPy entirely
+    if output_dtype == "bytes":
+        return bytes(raw_buf)
+
+    # Handle empty output (e.g., segment beyond file duration)
+    if not raw_buf:
+        return np.array([], dtype=np.int16 if output_dtype == "int16" else np.float32)
+
+    # Float PCM: FFmpeg already produced the final samples (zero-copy, writable view)
+    if pcm_dtype == np.float32:
+        return np.frombuffer(raw_buf, dtype=np.float32)
+
+    # 8-bit PCM: dequantize through the lookup table
+    if pcm_dtype == np.uint8:
+        return _pcm8_to_float32(np.frombuffer(raw_buf, dtype=np.uint8))
+
+    # Convert raw PCM bytes to int16 array (zero-copy view)
+    # The buffer is a private bytearray, so the view is writable and owns no shared memory
+    audio_int16 = np.frombuffer(raw_buf, dtype=np.int16)
+
+    # Raw sample values requested: return the view directly
+    if output_dtype == "int16":
+        return audio_int16
+
+    # Normalize int16 [-32768, 32767] to float32 [-1.0, 1.0]
+    # Short and long segments go through the Numba kernels when available
+    audio_float32 = _pcm16_to_float32(audio_int16)
+
+    return audio_float32
+
+
+def _pcm16_wav_range(file_path: str, start_ms: Optional[int], duration_ms: Optional[int]) -> Optional[tuple]:
+    """
+    Locate a time range in a WAV file that already is 16kHz mono 16-bit PCM, returns (offset, n_bytes) or None.
+
+    Only the RIFF chunk headers are read. None means the file is anything else (other container
+    or sample format, unreadable), in which case it has to be decoded by FFmpeg.
+    """
+    try:
+        # Only regular files: opening a FIFO or device would block and consume the bytes FFmpeg needs
+        if not stat.S_ISREG(os.stat(file_path).st_mode):
+            return None
+        with open(file_path, "rb") as f:
+            header = f.read(12)
+            if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+                return None
+            file_size = os.fstat(f.fileno()).st_size
+
+            is_pcm16_mono_16k = False
+            while True:
+                chunk_header = f.read(8)
+                if len(chunk_header) < 8:
+                    return None
+                chunk_id = chunk_header[:4]
+                chunk_size = int.from_bytes(chunk_header[4:], "little")
+
+                if chunk_id == b"fmt ":
+                    fmt = f.read(chunk_size)
+                    if len(fmt) < 16:
+                        return None
+                    format_tag, channels, sample_rate = struct.unpack_from("<HHI", fmt)
+                    bits_per_sample = struct.unpack_from("<H", fmt, 14)[0]
+                    # WAVE_FORMAT_EXTENSIBLE: the actual format is the start of the SubFormat GUID
+                    if format_tag == 0xFFFE and len(fmt) >= 26:
+                        format_tag = struct.unpack_from("<H", fmt, 24)[0]
+                    is_pcm16_mono_16k = (
+                        format_tag == 1
+                        and channels == FFmpegAudio.AUDIO_CHANNELS
+                        and sample_rate == FFmpegAudio.SAMPLE_RATE
+                        and bits_per_sample == 16
+                    )
+                    if not is_pcm16_mono_16k:
+                        return None
+                    # Chunks are word aligned
+                    f.seek(chunk_size & 1, os.SEEK_CUR)
+                elif chunk_id == b"data":
+                    if not is_pcm16_mono_16k:
+                        return None
+                    data_offset = f.tell()
+                    # Streamed or truncated files may declare more data than they hold
+                    data_bytes = min(chunk_size, file_size - data_offset) & ~1
+                    break
+                else:
+                    f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    except OSError:
+        return None
+
+    # Same sample arithmetic as the FFmpeg -ss/-t path
+    start_bytes = min(int((start_ms or 0) / 1000.0 * FFmpegAudio.SAMPLE_RATE) * 2, data_bytes)
+    n_bytes = data_bytes - start_bytes
+    if duration_ms is not None:
+        n_bytes = min(n_bytes, int((duration_ms / 1000.0) * FFmpegAudio.SAMPLE_RATE) * 2)
+    return data_offset + start_bytes, n_bytes
+
+
+def _read_pcm16_wav(file_path: str, start_ms: Optional[int], duration_ms: Optional[int]) -> Optional[bytearray]:
+    """Read a time range of a 16kHz mono 16-bit PCM WAV file without FFmpeg, returns None for any other file"""
+    wav_range = _pcm16_wav_range(file_path, start_ms, duration_ms)
+    if wav_range is None:
+        return None
+    data_offset, n_bytes = wav_range
+    raw_buf = bytearray(n_bytes)
+    with open(file_path, "rb", buffering=0) as f, memoryview(raw_buf) as view:
+        f.seek(data_offset)
+        filled = _readinto_full(f, view)
+    del raw_buf[filled:]
+    return raw_buf
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_path() -> str:
+    """Resolve the FFmpeg executable on PATH once, raising FFmpegNotFoundError if missing (failures are not cached)"""
+    path = shutil.which("ffmpeg")
+    if path is None:
+        raise FFmpegNotFoundError("FFmpeg not found. Please ensure FFmpeg is installed and available in PATH.")
+    return path
+
+
+def _aligned_empty(n_bytes: int) -> np.ndarray:
+    """Allocate an uninitialized uint8 buffer whose data starts on a _BUFFER_ALIGN byte boundary"""
+    raw = np.empty(n_bytes + _BUFFER_ALIGN, dtype=np.uint8)
+    offset = -raw.ctypes.data % _BUFFER_ALIGN
+    return raw[offset : offset + n_bytes]
+
+
+def _pcm_view(buf: np.ndarray, n_bytes: int, dtype: np.dtype) -> np.ndarray:
+    """View the first n_bytes of a uint8 PCM buffer as samples of dtype (zero-copy, trailing partial sample dropped)"""
+    return buf[: n_bytes - n_bytes % dtype.itemsize].view(dtype)
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_has_soxr() -> bool:
+    """Check once whether the FFmpeg build includes the libsoxr resampler"""
+    try:
+        result = subprocess.run(
+            [_ffmpeg_path(), "-hide_banner", "-buildconf"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
+            close_fds=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return b"--enable-libsoxr" in result.stdout
+
+
+def _grow_pipe(fd: int) -> None:
+    """Enlarge the kernel buffer of a pipe so FFmpeg can run further ahead of the reader, best effort (Linux only)"""
+    set_pipe_sz = getattr(fcntl, "F_SETPIPE_SZ", None)
+    if set_pipe_sz is None:
+        return
+    try:
+        fcntl.fcntl(fd, set_pipe_sz, _PIPE_SIZE)
+    except OSError:
+        # Limited by /proc/sys/fs/pipe-max-size or per-user quota, keep the default size
+        pass
+
+
+def _spawn_ffmpeg(cmd: list) -> subprocess.Popen:
+    """
+    Launch FFmpeg with unbuffered stdout/stderr pipes, raising FFmpegNotFoundError if the executable is missing.
+
+    No preexec hooks, cwd or session options are used and the executable path is absolute,
+    so that subprocess can take its posix_spawn path, whose cost does not grow with the
+    parent's memory size.
+    """
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,  # Capture stderr for error parsing
+            bufsize=0,  # Raw pipes: reads go straight from the kernel into the caller's buffer
+            # Python fds are non-inheritable by default (PEP 446), so closing them in the child is
+            # redundant; keeping close_fds=False lets subprocess use posix_spawn instead of fork+exec
+            close_fds=False,
+        )
+    except FileNotFoundError:
+        # FileNotFoundError from Popen means FFmpeg executable not found
+        # (e.g. removed since it was resolved): resolve it again on the next call
+        _ffmpeg_path.cache_clear()
+        raise FFmpegNotFoundError("FFmpeg not found. Please ensure FFmpeg is installed and available in PATH.")
+    _grow_pipe(process.stdout.fileno())
+    return process
+
+
+def _reap_ffmpeg(process: subprocess.Popen) -> None:
+    """Kill FFmpeg if it is still running and wait briefly for it; does nothing if it already exited and was reaped"""
+    if process.poll() is not None:
+        return
+    try:
+        process.kill()
+    except OSError:
+        pass
+    # Wait for termination (with timeout to avoid hanging)
+    try:
+        process.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        pass
+
+
+def _close_pipes(process: subprocess.Popen) -> None:
+    """Close FFmpeg's stdout/stderr pipes if they are still open"""
+    for pipe in (process.stdout, process.stderr):
+        if pipe is not None and not pipe.closed:
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+
+def _readinto_full(stream, view: memoryview) -> int:
+    """Fill view from an unbuffered pipe, retrying short reads; returns fewer bytes than len(view) only at EOF"""
+    total = 0
+    size = len(view)
+    while total < size:
+        n = stream.readinto(view[total:])
+        if not n:
+            break
+        total += n
+    return total
+
+
+def _read_pcm(stream, limit: Optional[int], size_hint: int, scratch: Optional[memoryview] = None) -> bytearray:
+    """
+    Read FFmpeg output into a new buffer, up to limit bytes (None: until EOF).
+
+    The first size_hint bytes (capped at _MAX_PREALLOC_BYTES) land in the result buffer directly;
+    anything beyond is appended through a reusable scratch buffer, so no bytes object is allocated per read.
+    """
+    prealloc_bytes = min(size_hint, _MAX_PREALLOC_BYTES)
+    raw_buf = bytearray(prealloc_bytes)
+    with memoryview(raw_buf) as view:
+        filled = _readinto_full(stream, view)
+    if filled < prealloc_bytes:
+        # EOF before the expected size (segment runs past the end of the file)
+        del raw_buf[filled:]
+        return raw_buf
+
+    remaining = None if limit is None else limit - filled
+    if scratch is None:
+        scratch = memoryview(bytearray(_PIPE_SIZE))
+    while remaining is None or remaining > 0:
+        read_bytes = _PIPE_SIZE if remaining is None else min(remaining, _PIPE_SIZE)
+        n = stream.readinto(scratch[:read_bytes])
+        if not n:
+            break
+        raw_buf += scratch[:n]
+        if remaining is not None:
+            remaining -= n
+    return raw_buf
+
+
+async def _read_pcm_async(stream) -> bytearray:
+    """Read an asyncio subprocess pipe until EOF into a new buffer"""
+    raw_buf = bytearray()
+    while True:
+        chunk = await stream.read(_PIPE_SIZE)
+        if not chunk:
+            return raw_buf
+        raw_buf += chunk
+
+
+def _validate_time_range(start_ms: Optional[int], duration_ms: Optional[int]) -> tuple:
+    """Type-check start_ms/duration_ms and auto-correct out-of-range values to None, returns (start_ms, duration_ms)"""
+    # Fast path: whole file requested, nothing to check
+    if start_ms is None and duration_ms is None:
+        return None, None
+
+    if start_ms is not None and not isinstance(start_ms, int):
+        raise TypeError(f"start_ms must be an int or None, got: {type(start_ms).__name__}")
+
+    if duration_ms is not None and not isinstance(duration_ms, int):
+        raise TypeError(f"duration_ms must be an int or None, got: {type(duration_ms).__name__}")
+
+    # If start_ms < 0, set to None (will read from beginning)
+    if start_ms is not None and start_ms < 0:
+        logger.warning("start_ms is negative (%sms), setting to None. Will read from beginning of file.", start_ms)
+        start_ms = None
+
+    # If duration_ms <= 0, set to None (will read to end)
+    if duration_ms is not None and duration_ms <= 0:
+        logger.warning("duration_ms is invalid (%sms), setting to None. Will read to end of file.", duration_ms)
+        duration_ms = None
+
+    return start_ms, duration_ms
+
+
+def _resolve_timeout_ms(timeout_ms: Optional[int]) -> int:
+    """Type-check timeout_ms and resolve None or invalid (<= 0) values to the default timeout"""
+    if timeout_ms is None:
+        return _default_timeout_ms()
+    if not isinstance(timeout_ms, int):
+        raise TypeError(f"timeout_ms must be an int or None, got: {type(timeout_ms).__name__}")
+    if timeout_ms <= 0:
+        default_timeout_ms = _default_timeout_ms()
+        logger.warning("timeout_ms is invalid (%sms), using default value %sms.", timeout_ms, default_timeout_ms)
+        return default_timeout_ms
+    return timeout_ms
+
+
+def _start_watchdog(process: subprocess.Popen, timeout_ms: int) -> tuple:
+    """Start a timer that kills process after timeout_ms, returns (timer, timed_out event)"""
+    timed_out = threading.Event()
+
+    def _on_timeout() -> None:
+        timed_out.set()
+        process.kill()
+
+    watchdog = threading.Timer(timeout_ms / 1000.0, _on_timeout)
+    watchdog.daemon = True
+    watchdog.start()
+    return watchdog, timed_out
+
+
+class _PcmPrefetcher:
+    """
+    Background reader that fills PCM buffers from FFmpeg stdout ahead of the consumer.
+
+    A fixed set of preallocated buffers cycles between a free pool and a ready queue,
+    so the next chunk is read from the pipe while the current one is being converted
+    and processed. At most _PREFETCH_DEPTH buffers exist. Buffers are uninitialized,
+    cache-line aligned uint8 arrays, so the sample views taken on them are aligned for SIMD loads.
+    With a convert function, conversion also runs on the reader thread, so the consumer
+    receives chunks that are ready to use. Each converted chunk is a separate array: to keep
+    the reader from converting further ahead, release a buffer only once its chunk is done with.
+    """
+
+    def __init__(
+        self,
+        stream,
+        bytes_per_chunk: int,
+        total_bytes: Optional[int],
+        convert: Optional[Callable[[np.ndarray, int], np.ndarray]] = None,
+    ):
+        """
+        Allocate the buffers and start the reader thread.
+
+        Args:
+            stream: Unbuffered FFmpeg stdout pipe, or a raw file opened with buffering=0.
+            bytes_per_chunk: Size of each buffer in bytes.
+            total_bytes: Stop after this many bytes. None means read until EOF.
+            convert: Optional function (buffer, n_bytes) -> array called on the reader thread for
+                each filled buffer. Its result must not reference the buffer.
+        """
+        self._stream = stream
+        self._convert = convert
+        # Size of every read, decided up front: whole buffers until EOF, or up to total_bytes
+        if total_bytes is None:
+            self._read_plan = itertools.repeat(bytes_per_chunk)
+        else:
+            full_chunks, tail_bytes = divmod(total_bytes, bytes_per_chunk)
+            self._read_plan = [bytes_per_chunk] * full_chunks + ([tail_bytes] if tail_bytes else [])
+        self._free: queue.Queue = queue.Queue()
+        self._ready: queue.Queue = queue.Queue()
+        for _ in range(_PREFETCH_DEPTH):
+            self._free.put(_aligned_empty(bytes_per_chunk))
+        self._thread = threading.Thread(target=self._run, name="ffmpeg-audio-reader", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Reader thread body: fill free buffers until EOF, the end of the read plan, or close()"""
+        try:
+            for read_bytes in self._read_plan:
+                buf = self._free.get()
+                if buf is None:
+                    # close() was called
+                    return
+                n_bytes = _readinto_full(self._stream, memoryview(buf)[:read_bytes])
+                if not n_bytes:
+                    break
+                converted = self._convert(buf, n_bytes) if self._convert is not None else None
+                self._ready.put((buf, n_bytes, converted))
+        except Exception as e:
+            # Hand the error to the consumer thread
+            self._ready.put(e)
+            return
+        self._ready.put(None)
+
+    def get(self) -> Optional[tuple]:
+        """Block until the next chunk is available, returns (buffer, n_bytes, converted) or None at end of data"""
+        item = self._ready.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def release(self, buf: np.ndarray) -> None:
+        """Return a buffer obtained from get() so the reader can fill it again"""
+        self._free.put(buf)
+
+    def close(self) -> None:
+        """Stop the reader thread; the pipe must already be at EOF (e.g. FFmpeg killed)"""
+        self._free.put(None)
+        self._thread.join()
+
+
+class _StderrDrain:
+    """
+    Collect FFmpeg stderr on a background thread.
+
+    Reading stderr concurrently keeps FFmpeg from blocking on a full stderr pipe
+    while the caller is busy reading stdout.
+    """
+
+    def __init__(self, stream):
+        """
+        Start the drain thread.
+
+        Args:
+            stream: Unbuffered FFmpeg stderr pipe.
+        """
+        self._stream = stream
+        self._data = b""
+        self._thread = threading.Thread(target=self._run, name="ffmpeg-audio-stderr", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Drain thread body: read stderr until EOF"""
+        try:
+            self._data = self._stream.read() or b""
+        except (OSError, ValueError):
+            pass
+
+    def text(self) -> str:
+        """Wait for EOF on stderr (FFmpeg exited or was killed) and return its decoded content"""
+        self._thread.join()
+        return self._data.decode("utf-8", errors="ignore")
 
 
 class FFmpegAudio:
@@ -58,37 +629,162 @@ class FFmpegAudio:
     SAMPLE_RATE = 16000  # Output sample rate in Hz
     AUDIO_CHANNELS = 1  # Output channel count (mono)
 
+    # Static parts of the FFmpeg argv, built once at class definition
+    # Using list form (not shell string) to avoid injection vulnerabilities
+    # The executable itself is resolved at call time (_ffmpeg_path)
+    _BASE_CMD = (
+        "-nostdin",  # Never read from stdin (no interaction, no stdin polling)
+        "-threads",
+        "0",  # Let the decoder pick the thread count
+        "-v",
+        "error",  # Only show error-level messages
+    )
+    _LOW_LATENCY_ARGS = ("-fflags", "+nobuffer")
+    # Minimal stream probing: skip most of FFmpeg's speculative demuxing before the first sample
+    _FAST_START_ARGS = ("-probesize", "32", "-analyzeduration", "0")
+    # Cheaper swresample setup: half the default filter length (32), default phase resolution
+    _FAST_RESAMPLE_ARGS = ("-af", "aresample=resampler=swr:filter_size=16:phase_shift=10")
+    # libsoxr (SIMD polyphase filters) at its default 20-bit precision, no dither
+    _SOXR_RESAMPLE_ARGS = ("-af", "aresample=resampler=soxr:precision=20:dither_method=none")
+    _STATIC_OUT_ARGS = (
+        "-vn",  # No video (extract audio only)
+        "-sn",  # No subtitles
+        "-dn",  # No data streams
+        "-ar",
+        str(SAMPLE_RATE),  # Resample to 16kHz (required for speech models)
+        "-ac",
+        str(AUDIO_CHANNELS),  # Convert to mono (downmix if stereo)
+    )
+    _STATIC_TAIL_ARGS = (
+        "-flush_packets",
+        "1",  # Write each packet to the pipe immediately
+        "-",  # Output to stdout
+    )
+
+    @staticmethod
+    def _build_command(
+        file_path: str,
+        start_ms: Optional[int],
+        duration_ms: Optional[int],
+        low_latency: bool = False,
+        pcm_format: str = "s16le",
+        fast_start: bool = False,
+        resampler: str = "default",
+    ) -> list:
+        """Build the FFmpeg argv that decodes file_path to 16kHz mono raw PCM (s16le by default) on stdout"""
+        # Absolute path resolved once: no PATH search per process launch
+        cmd = [_ffmpeg_path(), *FFmpegAudio._BASE_CMD]
+
+        # Reduce demuxer buffering so the first chunk is produced sooner (streaming)
+        if low_latency:
+            cmd += FFmpegAudio._LOW_LATENCY_ARGS
+
+        # Input options: must come before -i
+        if fast_start:
+            cmd += FFmpegAudio._FAST_START_ARGS
+
+        # Add seeking parameters before -i for better precision (input seeking)
+        # Placing -ss before -i makes FFmpeg seek in the input file, which is faster
+        # start_ms == 0 is the same as no seek, so no arguments are needed
+        if start_ms:
+            cmd += ("-ss", str(start_ms / 1000.0))
+
+        # Add duration limit if specified
+        # If both are None, FFmpeg will read the entire file
+        if duration_ms is not None:
+            cmd += ("-t", str(duration_ms / 1000.0))
+
+        # Add input file and audio processing parameters
+        cmd += ("-i", file_path)
+        cmd += FFmpegAudio._STATIC_OUT_ARGS
+        # Sources that already are 16kHz mono pass through without resampling in either case
+        if resampler == "fast":
+            cmd += FFmpegAudio._FAST_RESAMPLE_ARGS
+        elif resampler == "soxr":
+            if _ffmpeg_has_soxr():
+                cmd += FFmpegAudio._SOXR_RESAMPLE_ARGS
+            else:
+                logger.warning("FFmpeg is built without libsoxr, using the default resampler.")
+        cmd += ("-f", pcm_format)  # Raw PCM: 16-bit signed or 32-bit float little-endian, or unsigned 8-bit
+        cmd += FFmpegAudio._STATIC_TAIL_ARGS
+        return cmd
+
     @staticmethod
     def stream(
         file_path: str,
         start_ms: Optional[int] = None,
         duration_ms: Optional[int] = None,
-        chunk_duration_sec: int = _STREAM_CHUNK_DURATION_SEC,
+        chunk_duration_sec: Optional[int] = None,
+        yield_tile_samples: Optional[int] = None,
+        reuse_buffer: bool = False,
+        precision: Literal["s16", "f32", "u8"] = "s16",
+        fast_start: bool = False,
+        output_dtype: Literal["float32", "int16"] = "float32",
+        resampler: Literal["default", "fast", "soxr"] = "default",
     ) -> Iterator[np.ndarray]:
         """
         Stream audio file in chunks, yielding numpy arrays.
 
-        This method reads audio in chunks to minimize memory usage for large files.
+        This method reads audio in chunks to bound memory usage for large files: the next chunk
+        is read (and converted) in the background while the caller processes the current one,
+        so about two chunks are held in memory at a time.
         Each chunk is a numpy array of float32 samples in the range [-1.0, 1.0].
         The generator continues until the file ends or the specified duration is reached.
+        WAV files that already are 16kHz mono 16-bit PCM are read directly, without starting
+        FFmpeg (with the default precision="s16").
 
         Args:
             file_path: Path to input audio/video file (supports all FFmpeg formats)
             start_ms: Start position in milliseconds. None means from file beginning.
             duration_ms: Total duration to read in milliseconds. None means read until end.
                 If specified, reading stops when this duration is reached.
-            chunk_duration_sec: Duration of each chunk in seconds. Defaults to 1200s (20 minutes, configurable via FFMPEG_STREAM_CHUNK_DURATION_SEC env var).
+            chunk_duration_sec: Duration of each chunk in seconds. None (default) means 1200s (20 minutes, configurable via FFMPEG_STREAM_CHUNK_DURATION_SEC env var).
                 If <= 0, uses default with a warning.
+            yield_tile_samples: If set, each chunk read from FFmpeg is converted and yielded in
+                pieces of at most this many samples, so every yielded array is small enough to stay
+                in CPU cache while the caller processes it (e.g. 65536). None (default) yields whole chunks.
+                If <= 0, tiling is disabled with a warning.
+            reuse_buffer: If True, every chunk is written into one preallocated float32 buffer and the
+                yielded array is a view of it, so no array is allocated per chunk. The view is overwritten
+                when the next chunk is requested: copy it if you need to keep it. Defaults to False
+                (each yielded array is independent).
+            precision: PCM sample format FFmpeg decodes to. Defaults to "s16" (backward compatible).
+                - "s16": 16-bit PCM, normalized to float32 on the Python side.
+                - "f32": 32-bit float PCM, yielded as-is (no conversion pass at all). FFmpeg does not
+                  clip float output, so values may slightly exceed [-1.0, 1.0] for clipped sources.
+                - "u8": 8-bit PCM, dequantized to float32 with a table lookup. Half the pipe bandwidth
+                  of "s16" at the cost of ~48 dB dynamic range; meant for consumers such as VAD or
+                  silence detection that do not need full resolution.
+            fast_start: If True, FFmpeg probes the input as little as possible (-probesize 32
+                -analyzeduration 0), which cuts startup latency for short reads. Only safe for
+                well-formed files whose audio stream is declared in the header (WAV, MP3, FLAC,
+                MP4/M4A, ...); streams that are only discovered by demuxing may be missed.
+                Defaults to False.
+            output_dtype: Representation of the yielded chunks. Defaults to "float32" (backward compatible).
+                - "float32": normalized float32 arrays, see Yields.
+                - "int16": int16 arrays with the raw PCM sample values, yielded without any conversion
+                  (zero-copy views of the read buffers, half the size of float32). Requires precision="s16".
+            resampler: Sample rate conversion used by FFmpeg when the source is not 16kHz. Defaults to "default".
+                - "default": FFmpeg's standard swresample settings.
+                - "fast": swresample with a shorter filter (filter_size=16), noticeably cheaper for
+                  long inputs at a small cost in stopband attenuation; fine for speech recognition.
+                - "soxr": libsoxr, usually the fastest on long inputs at high quality. Requires an FFmpeg
+                  built with --enable-libsoxr; otherwise a warning is logged and "default" is used.
 
         Yields:
-            np.ndarray: Audio chunk as float32 array with shape (n_samples,).
+            np.ndarray: Audio chunk (or tile) as float32 array with shape (n_samples,).
                 Values are normalized to [-1.0, 1.0] range.
+                For output_dtype="int16" an int16 array of the same shape.
+                With reuse_buffer=True, only valid until the next chunk is requested.
 
         Raises:
             TypeError: If parameter types are invalid.
             ValueError: If file_path is empty or parameter values are invalid (after auto-correction):
                 - start_ms < 0 (auto-corrected to None)
                 - duration_ms <= 0 (auto-corrected to None)
+                - precision is not one of "s16", "f32", "u8"
+                - output_dtype is not one of "float32", "int16", or is "int16" with precision other than "s16"
+                - resampler is not one of "default", "fast", "soxr"
             FFmpegNotFoundError: If FFmpeg executable is not found in PATH.
             FileNotFoundError: If the input file does not exist.
             PermissionError: If file access is denied.
@@ -99,175 +795,224 @@ class FFmpegAudio:
         if not isinstance(file_path, str) or not file_path.strip():
             raise ValueError(f"file_path must be a non-empty string, got: {file_path!r}")
 
-        if not isinstance(chunk_duration_sec, int):
-            raise TypeError(f"chunk_duration_sec must be an int, got: {type(chunk_duration_sec).__name__}")
-
-        if start_ms is not None and not isinstance(start_ms, int):
-            raise TypeError(f"start_ms must be an int or None, got: {type(start_ms).__name__}")
-
-        if duration_ms is not None and not isinstance(duration_ms, int):
-            raise TypeError(f"duration_ms must be an int or None, got: {type(duration_ms).__name__}")
-
-        # Validate and auto-correct parameter values
-        # If start_ms < 0, set to None (will read from beginning)
-        if start_ms is not None and start_ms < 0:
-            logger.warning(f"start_ms is negative ({start_ms}ms), setting to None. Will read from beginning of file.")
-            start_ms = None
-
-        # If duration_ms <= 0, set to None (will read to end)
-        if duration_ms is not None and duration_ms <= 0:
-            logger.warning(f"duration_ms is invalid ({duration_ms}ms), setting to None. Will read to end of file.")
-            duration_ms = None
-
-        # Auto-correct invalid chunk duration
-        if chunk_duration_sec <= 0:
+        if chunk_duration_sec is not None and not isinstance(chunk_duration_sec, int):
+            raise TypeError(f"chunk_duration_sec must be an int or None, got: {type(chunk_duration_sec).__name__}")
+
+        if yield_tile_samples is not None and not isinstance(yield_tile_samples, int):
+            raise TypeError(f"yield_tile_samples must be an int or None, got: {type(yield_tile_samples).__name__}")
+
+        # Validate and auto-correct time range
+        start_ms, duration_ms = _validate_time_range(start_ms, duration_ms)
+
+        # Auto-correct invalid tile size
+        if yield_tile_samples is not None and yield_tile_samples <= 0:
+            logger.warning("yield_tile_samples is invalid (%s), yielding whole chunks.", yield_tile_samples)
+            yield_tile_samples = None
+
+        if not isinstance(reuse_buffer, bool):
+            raise TypeError(f"reuse_buffer must be a bool, got: {type(reuse_buffer).__name__}")
+
+        if not isinstance(fast_start, bool):
+            raise TypeError(f"fast_start must be a bool, got: {type(fast_start).__name__}")
+
+        if precision not in _PRECISION_FORMATS:
+            raise ValueError(f"precision must be one of {tuple(_PRECISION_FORMATS)}, got: {precision!r}")
+        if output_dtype not in _STREAM_OUTPUT_DTYPES:
+            raise ValueError(f"output_dtype must be one of {_STREAM_OUTPUT_DTYPES}, got: {output_dtype!r}")
+        if precision != "s16" and output_dtype == "int16":
+            raise ValueError('output_dtype="int16" requires precision="s16"')
+        if resampler not in _RESAMPLERS:
+            raise ValueError(f"resampler must be one of {_RESAMPLERS}, got: {resampler!r}")
+        pcm_format, pcm_dtype = _PRECISION_FORMATS[precision]
+
+        # Chunks are yielded as views of the read buffers, without a conversion pass
+        yield_raw = precision == "f32" or output_dtype == "int16"
+        # Normalization to float32 for the remaining (integer PCM) cases
+        to_float32 = _pcm8_to_float32 if precision == "u8" else _pcm16_to_float32
+
+        # Resolve default and auto-correct invalid chunk duration
+        if chunk_duration_sec is None:
+            chunk_duration_sec = _stream_chunk_duration_sec()
+        elif chunk_duration_sec <= 0:
+            default_chunk_duration_sec = _stream_chunk_duration_sec()
             logger.warning(
-                f"Invalid `chunk_duration_sec` ({chunk_duration_sec}). Using default: {_STREAM_CHUNK_DURATION_SEC}",
+                "Invalid `chunk_duration_sec` (%s). Using default: %s",
+                chunk_duration_sec,
+                default_chunk_duration_sec,
             )
-            chunk_duration_sec = _STREAM_CHUNK_DURATION_SEC
+            chunk_duration_sec = default_chunk_duration_sec
 
-        # Build FFmpeg command
-        # Using list form (not shell string) to avoid injection vulnerabilities
-        cmd = ["ffmpeg", "-v", "error"]  # Only show error-level messages
-
-        # Add seeking parameters before -i for better precision (input seeking)
-        # Placing -ss before -i makes FFmpeg seek in the input file, which is faster
-        if start_ms is not None:
-            start_sec = start_ms / 1000.0
-            cmd.extend(["-ss", str(start_sec)])
+        # Calculate chunk size: samples per chunk * bytes per sample (2 for s16, 4 for f32, 1 for u8)
+        sample_bytes = pcm_dtype.itemsize
+        chunk_size = int(chunk_duration_sec * FFmpegAudio.SAMPLE_RATE)
+        bytes_per_chunk = chunk_size * sample_bytes
 
-        # Add duration limit if specified
+        # Track total samples read if duration limit is specified
+        total_read_samples = 0
+        total_duration_samples = None
         if duration_ms is not None:
-            duration_sec = duration_ms / 1000.0
-            cmd.extend(["-t", str(duration_sec)])
+            total_duration_samples = int((duration_ms / 1000.0) * FFmpegAudio.SAMPLE_RATE)
 
-        # Add input file and audio processing parameters
-        cmd.extend(
-            [
-                "-i",
-                file_path,
-                "-vn",  # No video (extract audio only)
-                "-sn",  # No subtitles
-                "-dn",  # No data streams
-                "-ar",
-                str(FFmpegAudio.SAMPLE_RATE),  # Resample to 16kHz (required for speech models)
-                "-ac",
-                str(FFmpegAudio.AUDIO_CHANNELS),  # Convert to mono (downmix if stereo)
-                "-f",
-                "s16le",  # 16-bit signed little-endian PCM (raw audio format)
-                "-",  # Output to stdout for streaming
-            ]
-        )
+        # Persistent output buffer (reuse_buffer=True): one chunk or one tile, overwritten on each yield
+        # Not needed for f32 or int16, whose chunks are yielded straight from the PCM buffers
+        # Allocated before the source is opened, so a MemoryError here leaves nothing to clean up
+        out_buf: Optional[np.ndarray] = None
+        if reuse_buffer and not yield_raw:
+            out_buf = np.empty(min(chunk_size, yield_tile_samples or chunk_size), dtype=np.float32)
 
-        # Launch FFmpeg subprocess
+        # WAV that already is 16kHz mono 16-bit PCM: read the samples straight from the file,
+        # otherwise decode with FFmpeg and read its stdout
         process: Optional[subprocess.Popen] = None
-        try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,  # Capture stderr for error parsing
-                bufsize=10**7,  # 10MB buffer for efficient I/O
+        stderr_drain: Optional[_StderrDrain] = None
+        wav_range = _pcm16_wav_range(file_path, start_ms, duration_ms) if precision == "s16" else None
+        if wav_range is not None:
+            data_offset, wav_bytes = wav_range
+            source = open(file_path, "rb", buffering=0)
+            source.seek(data_offset)
+        else:
+            # Build FFmpeg command
+            cmd = FFmpegAudio._build_command(
+                file_path,
+                start_ms,
+                duration_ms,
+                low_latency=True,
+                pcm_format=pcm_format,
+                fast_start=fast_start,
+                resampler=resampler,
             )
-        except FileNotFoundError:
-            # FileNotFoundError from Popen means FFmpeg executable not found
-            raise FFmpegNotFoundError("FFmpeg not found. Please ensure FFmpeg is installed and available in PATH.")
 
-        # Calculate chunk size: samples per chunk * 2 bytes per sample (16-bit)
-        chunk_size = int(chunk_duration_sec * FFmpegAudio.SAMPLE_RATE)
-        bytes_per_chunk = chunk_size * 2
+            # Launch FFmpeg subprocess
+            process = _spawn_ffmpeg(cmd)
+            source = process.stdout
 
-        # Track total samples read if duration limit is specified
-        total_read_samples = 0
-        total_duration_samples = None
-        if duration_ms is not None:
-            total_duration_samples = int((duration_ms / 1000.0) * FFmpegAudio.SAMPLE_RATE)
+            # Drain stderr concurrently, so warnings written during a long run can never fill
+            # the stderr pipe and stall FFmpeg (and with it stdout)
+            stderr_drain = _StderrDrain(process.stderr)
 
+        prefetcher: Optional[_PcmPrefetcher] = None
         try:
-            while True:
-                # Check if process has terminated (poll() returns returncode or None)
-                if process.poll() is not None:
-                    # Process finished, check for errors
-                    if process.returncode != 0:
-                        stderr_output = process.stderr.read().decode("utf-8", errors="ignore")
-                        raise parse_ffmpeg_error(stderr_output, file_path, process.returncode)
-                    # Normal termination, no more data
-                    break
+            # Read FFmpeg output on a background thread into reusable PCM buffers,
+            # so reading the next chunk overlaps with converting and consuming this one
+            total_bytes = total_duration_samples * sample_bytes if total_duration_samples is not None else None
+            if wav_range is not None:
+                total_bytes = wav_bytes
 
-                # Stop if duration limit reached
-                if total_duration_samples is not None and total_read_samples >= total_duration_samples:
-                    break
+            # Whole integer PCM chunks into fresh arrays: convert on the reader thread as well,
+            # so normalizing the next chunk also overlaps with the caller's work
+            convert = None
+            if not yield_raw and yield_tile_samples is None and out_buf is None:
 
-                # Calculate how many bytes to read this iteration
-                # May be less than bytes_per_chunk if approaching duration limit
-                read_bytes = bytes_per_chunk
-                if total_duration_samples is not None:
-                    remaining_samples = total_duration_samples - total_read_samples
-                    remaining_bytes = remaining_samples * 2
-                    if remaining_bytes < read_bytes:
-                        read_bytes = remaining_bytes
+                def convert(buf: np.ndarray, n_bytes: int) -> np.ndarray:
+                    return to_float32(_pcm_view(buf, n_bytes, pcm_dtype))
 
-                # Read raw PCM bytes from FFmpeg stdout
-                raw_bytes = process.stdout.read(read_bytes)
+            prefetcher = _PcmPrefetcher(source, bytes_per_chunk, total_bytes, convert)
 
-                # EOF reached (no more data)
-                if not raw_bytes:
-                    break
+            while True:
+                item = prefetcher.get()
 
-                # Convert raw bytes to int16 array (zero-copy operation)
-                # frombuffer creates a view without copying data, very efficient
-                audio_int16 = np.frombuffer(raw_bytes, dtype=np.int16)
+                # EOF or duration limit reached (no more data)
+                if item is None:
+                    break
+                pcm_buf, n_bytes, converted = item
+
+                # Already converted on the reader thread
+                if converted is not None:
+                    total_read_samples += len(converted)
+                    yield converted
+                    # Hand the buffer back only when the caller asks for the next chunk, so the
+                    # reader converts at most one chunk ahead of the one the caller holds
+                    prefetcher.release(pcm_buf)
+                    continue
+
+                # Float PCM, or raw int16 requested: the buffer already holds the final samples,
+                # yield views of it
+                if yield_raw:
+                    audio = _pcm_view(pcm_buf, n_bytes, pcm_dtype)
+                    total_read_samples += len(audio)
+                    if not reuse_buffer:
+                        # The yielded arrays keep this buffer, so the reader gets a fresh one
+                        prefetcher.release(_aligned_empty(bytes_per_chunk))
+                    if yield_tile_samples is not None:
+                        for offset in range(0, len(audio), yield_tile_samples):
+                            yield audio[offset : offset + yield_tile_samples]
+                    else:
+                        yield audio
+                    if reuse_buffer:
+                        # The caller is done with the views, the buffer can be refilled
+                        prefetcher.release(pcm_buf)
+                    continue
+
+                # View the filled part of the buffer as int16 (or uint8) samples (zero-copy operation)
+                # The buffer is a NumPy array, so this is a plain ndarray view (no buffer protocol round trip)
+                audio_pcm = _pcm_view(pcm_buf, n_bytes, pcm_dtype)
 
                 # Track progress for duration limiting
-                total_read_samples += len(audio_int16)
-
-                # Normalize int16 [-32768, 32767] to float32 [-1.0, 1.0]
-                # This format is standard for audio processing libraries
-                audio_float32 = audio_int16.astype(np.float32) / 32768.0
+                total_read_samples += len(audio_pcm)
+
+                # Tiled output: convert each tile just before yielding it, so it is still
+                # cache-resident when the caller processes it
+                if yield_tile_samples is not None:
+                    for offset in range(0, len(audio_pcm), yield_tile_samples):
+                        tile = audio_pcm[offset : offset + yield_tile_samples]
+                        yield to_float32(tile, None if out_buf is None else out_buf[: len(tile)])
+                    prefetcher.release(pcm_buf)
+                    continue
+
+                # Normalize int16 [-32768, 32767] (or uint8 [0, 255]) to float32 [-1.0, 1.0]
+                # Single pass (fused ufunc or table lookup, or Numba kernel for small/large int16 chunks when available)
+                # The result never aliases the PCM buffer, so it can be refilled right away
+                audio_float32 = to_float32(audio_pcm, None if out_buf is None else out_buf[: len(audio_pcm)])
+                prefetcher.release(pcm_buf)
 
                 yield audio_float32
 
+            # Stop if duration limit reached (FFmpeg is killed during cleanup)
+            if total_duration_samples is not None and total_read_samples >= total_duration_samples:
+                return
+
+            # WAV read directly: end of data, no process to check
+            if process is None:
+                return
+
+            # EOF reached: wait for FFmpeg to exit and check for errors
+            if process.wait() != 0:
+                raise parse_ffmpeg_error(stderr_drain.text(), file_path, process.returncode)
+
         finally:
             # Ensure subprocess is properly cleaned up
-            if process:
-                # Close pipes to release resources
-                try:
-                    process.stdout.close()
-                    process.stderr.close()
-                except Exception:
-                    pass
-                # Terminate process if still running
-                try:
-                    process.kill()
-                except Exception:
-                    pass
-                # Wait for termination (with timeout to avoid hanging)
-                try:
-                    process.wait(timeout=1)
-                except Exception:
-                    pass
-
-                # Final error check: if process terminated with error, raise exception
-                # This catches errors that might have occurred after the main loop
-                if process.returncode is not None and process.returncode != 0:
-                    try:
-                        stderr_output = process.stderr.read().decode("utf-8", errors="ignore")
-                    except Exception:
-                        stderr_output = ""
-                    raise parse_ffmpeg_error(stderr_output, file_path, process.returncode)
+            # Terminate process if still running (early close by the caller, errors, duration limit);
+            # this also unblocks the reader thread with EOF
+            if process is not None:
+                _reap_ffmpeg(process)
+                stderr_drain.text()
+            # Stop the reader thread before closing the pipe (or file) it reads from
+            if prefetcher is not None:
+                prefetcher.close()
+            # Close pipes to release resources
+            if process is not None:
+                _close_pipes(process)
+            else:
+                source.close()
 
     @staticmethod
     def read(
         file_path: str,
         start_ms: Optional[int] = None,
         duration_ms: Optional[int] = None,
-        timeout_ms: int = _DEFAULT_TIMEOUT_MS,
-    ) -> np.ndarray:
+        timeout_ms: Optional[int] = None,
+        output_dtype: Literal["float32", "int16", "bytes"] = "float32",
+        precision: Literal["s16", "f32", "u8"] = "s16",
+        fast_start: bool = False,
+        resampler: Literal["default", "fast", "soxr"] = "default",
+    ) -> Union[np.ndarray, bytes]:
         """
         Read audio data from a file in one operation.
 
         This method reads audio data into memory at once. If both start_ms and duration_ms
         are None, it reads the entire file. For large files or streaming use cases,
         consider using stream() instead.
+        WAV files that already are 16kHz mono 16-bit PCM are read directly, without starting
+        FFmpeg (with the default precision="s16").
 
         The output format (16kHz mono float32) is optimized for speech processing and energy
         detection algorithms. The sample rate matches SAMPLE_RATE constant.
@@ -279,10 +1024,35 @@ class FFmpegAudio:
             duration_ms: Segment duration in milliseconds. None means read until end of file.
                 If start_ms is provided but duration_ms is None, reads from start_ms to end of file.
                 If both start_ms and duration_ms are None, reads the entire file.
-            timeout_ms: Maximum processing time in milliseconds. Defaults to 300000ms (5 minutes, configurable via FFMPEG_TIMEOUT_MS env var).
+            timeout_ms: Maximum processing time in milliseconds. None (default) means 300000ms (5 minutes, configurable via FFMPEG_TIMEOUT_MS env var).
                 - If <= 0, uses default timeout with a warning.
                 - If > 0, uses the specified value.
                 - To disable timeout, explicitly pass a very large value (not recommended for production).
+            output_dtype: Representation of the returned audio. Defaults to "float32" (backward compatible).
+                - "float32": normalized float32 array, see Returns.
+                - "int16": int16 array with the raw PCM sample values, skipping normalization (half the memory).
+                - "bytes": the raw 16-bit signed little-endian PCM bytes, without creating any array.
+            precision: PCM sample format FFmpeg decodes to. Defaults to "s16" (backward compatible).
+                - "s16": 16-bit PCM, normalized to float32 on the Python side.
+                - "f32": 32-bit float PCM, returned as a zero-copy float32 view (no conversion pass).
+                  FFmpeg does not clip float output, so values may slightly exceed [-1.0, 1.0] for clipped
+                  sources. With output_dtype="bytes" the raw float32 little-endian bytes are returned;
+                  output_dtype="int16" is not supported.
+                - "u8": 8-bit PCM, dequantized to float32 with a table lookup. Half the pipe bandwidth
+                  of "s16" at the cost of ~48 dB dynamic range; meant for consumers such as VAD or
+                  silence detection that do not need full resolution. With output_dtype="bytes" the raw
+                  unsigned 8-bit bytes are returned; output_dtype="int16" is not supported.
+            fast_start: If True, FFmpeg probes the input as little as possible (-probesize 32
+                -analyzeduration 0), which cuts startup latency for short reads. Only safe for
+                well-formed files whose audio stream is declared in the header (WAV, MP3, FLAC,
+                MP4/M4A, ...); streams that are only discovered by demuxing may be missed.
+                Defaults to False.
+            resampler: Sample rate conversion used by FFmpeg when the source is not 16kHz. Defaults to "default".
+                - "default": FFmpeg's standard swresample settings.
+                - "fast": swresample with a shorter filter (filter_size=16), noticeably cheaper for
+                  long inputs at a small cost in stopband attenuation; fine for speech recognition.
+                - "soxr": libsoxr, usually the fastest on long inputs at high quality. Requires an FFmpeg
+                  built with --enable-libsoxr; otherwise a warning is logged and "default" is used.
 
         Returns:
             np.ndarray: Audio data as float32 array with shape (n_samples,).
@@ -290,6 +1060,7 @@ class FFmpegAudio:
                 - shape: (n_samples,) where n_samples depends on the audio duration
                 - value range: [-1.0, 1.0]
                 - sample rate: SAMPLE_RATE (16000 Hz)
+            For output_dtype="int16" an int16 array of the same shape, for output_dtype="bytes" a bytes object.
 
         Raises:
             TypeError: If parameter types are invalid.
@@ -297,147 +1068,546 @@ class FFmpegAudio:
                 - start_ms < 0 (auto-corrected to None)
                 - duration_ms <= 0 (auto-corrected to None)
                 - timeout_ms <= 0 (auto-corrected to default timeout)
+                - output_dtype is not one of "float32", "int16", "bytes"
+                - precision is not one of "s16", "f32", "u8", or is not "s16" with output_dtype="int16"
+                - resampler is not one of "default", "fast", "soxr"
             FileNotFoundError: If the input file does not exist.
             FFmpegNotFoundError: If FFmpeg executable is not found in PATH.
             FFmpegAudioError: If FFmpeg processing fails or timeout is exceeded.
         """
-        # Validate parameter types
-        if start_ms is not None and not isinstance(start_ms, int):
-            raise TypeError(f"start_ms must be an int or None, got: {type(start_ms).__name__}")
-
-        if duration_ms is not None and not isinstance(duration_ms, int):
-            raise TypeError(f"duration_ms must be an int or None, got: {type(duration_ms).__name__}")
+        start_ms, duration_ms, timeout_ms = FFmpegAudio._validate_read_args(
+            start_ms, duration_ms, timeout_ms, output_dtype, precision, fast_start, resampler
+        )
+        return FFmpegAudio._read_unchecked(file_path, start_ms, duration_ms, timeout_ms, output_dtype, precision, fast_start, resampler)
 
-        if not isinstance(timeout_ms, int):
-            raise TypeError(f"timeout_ms must be an int, got: {type(timeout_ms).__name__}")
+    @staticmethod
+    def _validate_read_args(
+        start_ms: Optional[int],
+        duration_ms: Optional[int],
+        timeout_ms: Optional[int],
+        output_dtype: str,
+        precision: str,
+        fast_start: bool,
+        resampler: str,
+    ) -> tuple:
+        """Validate and auto-correct read() arguments, returns (start_ms, duration_ms, timeout_ms)"""
+        # Validate parameter types, resolve default and auto-correct invalid timeout
+        timeout_ms = _resolve_timeout_ms(timeout_ms)
+
+        if not isinstance(fast_start, bool):
+            raise TypeError(f"fast_start must be a bool, got: {type(fast_start).__name__}")
+
+        if output_dtype not in _OUTPUT_DTYPES:
+            raise ValueError(f"output_dtype must be one of {_OUTPUT_DTYPES}, got: {output_dtype!r}")
+
+        if precision not in _PRECISION_FORMATS:
+            raise ValueError(f"precision must be one of {tuple(_PRECISION_FORMATS)}, got: {precision!r}")
+        if precision != "s16" and output_dtype == "int16":
+            raise ValueError('output_dtype="int16" requires precision="s16"')
+        if resampler not in _RESAMPLERS:
+            raise ValueError(f"resampler must be one of {_RESAMPLERS}, got: {resampler!r}")
+
+        # Validate and auto-correct time range
+        start_ms, duration_ms = _validate_time_range(start_ms, duration_ms)
 
         # Validate parameter logic
         # If start_ms is specified but duration_ms is None, warn and allow reading to end of file
         if start_ms is not None and duration_ms is None:
-            logger.warning(f"start_ms is specified ({start_ms}ms) but duration_ms is None. " "Will read from start_ms to end of file.")
-
-        # Validate and auto-correct parameter values
-        # If start_ms < 0, set to None (will read from beginning)
-        if start_ms is not None and start_ms < 0:
-            logger.warning(f"start_ms is negative ({start_ms}ms), setting to None. Will read from beginning of file.")
-            start_ms = None
-
-        # If duration_ms <= 0, set to None (will read to end)
-        if duration_ms is not None and duration_ms <= 0:
-            logger.warning(f"duration_ms is invalid ({duration_ms}ms), setting to None. Will read to end of file.")
-            duration_ms = None
-
-        # Handle timeout_ms: auto-correct invalid values
-        # If timeout_ms <= 0, use default timeout with warning
-        if timeout_ms <= 0:
-            logger.warning(f"timeout_ms is invalid ({timeout_ms}ms), using default value {_DEFAULT_TIMEOUT_MS}ms.")
-            timeout_ms = _DEFAULT_TIMEOUT_MS
-        # else: timeout_ms > 0, use the specified value
-
-        # Convert milliseconds to seconds for FFmpeg (only if provided)
-        start_sec = start_ms / 1000.0 if start_ms is not None else None
-        duration_sec = duration_ms / 1000.0 if duration_ms is not None else None
-
-        # Build FFmpeg command with input seeking for precision
-        cmd = ["ffmpeg", "-v", "error"]  # Only show error-level messages
-
-        # Add seeking before -i for input seeking (more precise than output seeking)
-        # Only add -ss if start_ms is specified
-        if start_ms is not None:
-            cmd.extend(["-ss", str(start_sec)])
-
-        # Add duration limit only if duration_ms is specified
-        # If both are None, FFmpeg will read the entire file
-        if duration_ms is not None:
-            cmd.extend(["-t", str(duration_sec)])
+            logger.warning("start_ms is specified (%sms) but duration_ms is None. Will read from start_ms to end of file.", start_ms)
 
-        # Add input file and audio processing parameters
-        cmd.extend(
-            [
-                "-i",
-                file_path,
-                "-vn",  # No video (audio extraction only)
-                "-sn",  # No subtitles
-                "-dn",  # No data streams
-                "-ar",
-                str(FFmpegAudio.SAMPLE_RATE),  # Resample to 16kHz (standard for speech processing)
-                "-ac",
-                "1",  # Convert to mono (downmix stereo to mono)
-                "-f",
-                "s16le",  # 16-bit signed little-endian PCM (raw audio format)
-                "-",  # Output to stdout for reading
-            ]
+        return start_ms, duration_ms, timeout_ms
+
+    @staticmethod
+    def _read_unchecked(
+        file_path: str,
+        start_ms: Optional[int],
+        duration_ms: Optional[int],
+        timeout_ms: int,
+        output_dtype: str,
+        precision: str,
+        fast_start: bool,
+        resampler: str,
+    ) -> Union[np.ndarray, bytes]:
+        """Body of read() for internal callers whose arguments are already validated (timeout_ms resolved)"""
+        pcm_format, pcm_dtype = _PRECISION_FORMATS[precision]
+
+        # WAV that already is 16kHz mono 16-bit PCM: read the samples directly, without FFmpeg
+        raw_buf = _read_pcm16_wav(file_path, start_ms, duration_ms) if precision == "s16" else None
+        if raw_buf is not None:
+            return _pcm_to_output(raw_buf, output_dtype, pcm_dtype)
+
+        # Build FFmpeg command
+        cmd = FFmpegAudio._build_command(
+            file_path,
+            start_ms,
+            duration_ms,
+            pcm_format=pcm_format,
+            fast_start=fast_start,
+            resampler=resampler,
         )
 
         # Launch FFmpeg subprocess
-        process = None
-        try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                bufsize=10**7,  # 10MB buffer for efficient I/O
-            )
-        except FileNotFoundError:
-            # FileNotFoundError from Popen indicates FFmpeg executable not found
-            raise FFmpegNotFoundError("FFmpeg not found. Please ensure FFmpeg is installed and available in PATH.")
+        process = _spawn_ffmpeg(cmd)
+
+        # Drain stderr concurrently and kill FFmpeg if it runs past the timeout
+        stderr_drain = _StderrDrain(process.stderr)
+        watchdog, timed_out = _start_watchdog(process, timeout_ms)
 
         try:
-            # Read all output in one operation (blocking until complete or timeout)
-            timeout_sec = timeout_ms / 1000.0
-            raw_bytes, stderr_bytes = process.communicate(timeout=timeout_sec)
+            # Known duration: preallocate the whole result and let FFmpeg's output land in it directly
+            expected_bytes = 0
+            if duration_ms is not None:
+                expected_bytes = int((duration_ms / 1000.0) * FFmpegAudio.SAMPLE_RATE) * pcm_dtype.itemsize
+            raw_buf = _read_pcm(process.stdout, None, expected_bytes)
+
+            # EOF reached: wait for exit while the watchdog is still armed
+            process.wait()
+            # cancel() cannot stop a timer that already fired: wait for it to finish before checking
+            watchdog.cancel()
+            watchdog.join()
+
+            # Timeout occurred: the watchdog killed the process (the timer may also fire just after
+            # FFmpeg exited on its own, which is not a timeout)
+            if timed_out.is_set() and process.returncode != 0:
+                raise FFmpegAudioError(
+                    f"FFmpeg timeout while processing {file_path}",
+                    file_path=file_path,
+                )
 
             # Check for FFmpeg errors
             if process.returncode != 0:
-                stderr_output = stderr_bytes.decode("utf-8", errors="ignore")
-                raise parse_ffmpeg_error(stderr_output, file_path, process.returncode)
+                raise parse_ffmpeg_error(stderr_drain.text(), file_path, process.returncode)
+
+            return _pcm_to_output(raw_buf, output_dtype, pcm_dtype)
+
+        finally:
+            # Ensure proper cleanup of subprocess resources
+            watchdog.cancel()
+            # Terminate if still running; this also lets the stderr thread reach EOF
+            _reap_ffmpeg(process)
+            stderr_drain.text()
+            # Close pipes
+            _close_pipes(process)
 
-            # Handle empty output (e.g., segment beyond file duration)
-            if not raw_bytes:
-                return np.array([], dtype=np.float32)
+    @staticmethod
+    def read_many(
+        specs: Iterable[dict],
+        max_workers: Optional[int] = None,
+    ) -> List[Union[np.ndarray, bytes]]:
+        """
+        Read several files (or segments) concurrently, one FFmpeg process per worker.
 
-            # Convert raw PCM bytes to int16 array (zero-copy view)
-            audio_int16 = np.frombuffer(raw_bytes, dtype=np.int16)
+        Each spec is a dict of keyword arguments for read(), e.g.
+        {"file_path": "a.mp3", "start_ms": 1000, "duration_ms": 5000}. The work is done
+        by FFmpeg and by pipe I/O that releases the GIL, so a thread pool is enough to
+        keep several FFmpeg processes busy at once.
 
-            # Normalize int16 [-32768, 32767] to float32 [-1.0, 1.0]
-            # Standard audio processing format
-            audio_float32 = audio_int16.astype(np.float32) / 32768.0
+        Args:
+            specs: Keyword arguments for read(), one dict per result.
+            max_workers: Maximum number of concurrent FFmpeg processes. None (default) means os.cpu_count().
+                If <= 0, will be auto-corrected to default with a warning.
 
-            return audio_float32
+        Returns:
+            list: Results of read() in the same order as specs.
 
-        except subprocess.TimeoutExpired:
-            # Timeout occurred, kill process and raise error
-            if process:
-                process.kill()
-            raise FFmpegAudioError(
-                f"FFmpeg timeout while processing {file_path}",
-                file_path=file_path,
+        Raises:
+            TypeError: If max_workers is not an int or None, or a spec is not a dict.
+            Any exception raised by read() for a spec; the first failing spec (in order) is reported.
+        """
+        if max_workers is not None and not isinstance(max_workers, int):
+            raise TypeError(f"max_workers must be an int or None, got: {type(max_workers).__name__}")
+
+        specs = list(specs)
+        for spec in specs:
+            if not isinstance(spec, dict):
+                raise TypeError(f"each spec must be a dict of read() arguments, got: {type(spec).__name__}")
+
+        if max_workers is not None and max_workers <= 0:
+            logger.warning("max_workers is invalid (%s), using os.cpu_count().", max_workers)
+            max_workers = None
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        if not specs:
+            return []
+
+        # No point in more threads than files
+        max_workers = min(max_workers, len(specs))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ffmpeg-audio") as executor:
+            return list(executor.map(lambda spec: FFmpegAudio.read(**spec), specs))
+
+    @staticmethod
+    async def read_async(
+        file_path: str,
+        start_ms: Optional[int] = None,
+        duration_ms: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+        output_dtype: Literal["float32", "int16", "bytes"] = "float32",
+        precision: Literal["s16", "f32", "u8"] = "s16",
+        fast_start: bool = False,
+        resampler: Literal["default", "fast", "soxr"] = "default",
+    ) -> Union[np.ndarray, bytes]:
+        """
+        Asynchronous read(): same arguments and result, without blocking the event loop.
+
+        FFmpeg is run through asyncio's subprocess support, so many reads can be awaited
+        concurrently, e.g. with asyncio.gather(), each in its own FFmpeg process.
+        Blocking steps run on worker threads: reading WAV files that already are 16kHz mono 16-bit PCM,
+        building the FFmpeg command (executable lookup, soxr probe) and converting long results.
+
+        Args:
+            Same as read().
+
+        Returns:
+            np.ndarray or bytes: Audio data, see read().
+
+        Raises:
+            Same exceptions as read().
+        """
+        # Only needed here, so importing the package does not pay for asyncio
+        import asyncio
+
+        start_ms, duration_ms, timeout_ms = FFmpegAudio._validate_read_args(
+            start_ms, duration_ms, timeout_ms, output_dtype, precision, fast_start, resampler
+        )
+        pcm_format, pcm_dtype = _PRECISION_FORMATS[precision]
+
+        # WAV that already is 16kHz mono 16-bit PCM: plain file reads and conversion, off the event loop
+        if precision == "s16":
+
+            def read_wav() -> Optional[Union[np.ndarray, bytes]]:
+                raw_buf = _read_pcm16_wav(file_path, start_ms, duration_ms)
+                return None if raw_buf is None else _pcm_to_output(raw_buf, output_dtype, pcm_dtype)
+
+            result = await asyncio.to_thread(read_wav)
+            if result is not None:
+                return result
+
+        # Build FFmpeg command, off the event loop: the first call resolves the executable
+        # in PATH and, for resampler="soxr", runs FFmpeg once to probe its build
+        cmd = await asyncio.to_thread(
+            FFmpegAudio._build_command,
+            file_path,
+            start_ms,
+            duration_ms,
+            pcm_format=pcm_format,
+            fast_start=fast_start,
+            resampler=resampler,
+        )
+
+        # Launch FFmpeg subprocess (close_fds=False for posix_spawn, see _spawn_ffmpeg())
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=_PIPE_SIZE,
+                close_fds=False,
+            )
+        except FileNotFoundError:
+            _ffmpeg_path.cache_clear()
+            raise FFmpegNotFoundError("FFmpeg not found. Please ensure FFmpeg is installed and available in PATH.")
+
+        try:
+            # Read stdout and stderr concurrently until FFmpeg exits, within the timeout
+            raw_buf, stderr, returncode = await asyncio.wait_for(
+                asyncio.gather(_read_pcm_async(process.stdout), process.stderr.read(), process.wait()),
+                timeout_ms / 1000.0,
             )
+        except asyncio.TimeoutError:
+            raise FFmpegAudioError(f"FFmpeg timeout while processing {file_path}", file_path=file_path) from None
         finally:
-            # Ensure proper cleanup of subprocess resources
-            if process:
-                # Close pipes
-                try:
-                    process.stdout.close()
-                    process.stderr.close()
-                except Exception:
-                    pass
-                # Terminate if still running
-                try:
-                    process.kill()
-                except Exception:
-                    pass
-                # Wait for termination
+            # Timeout, cancellation or error: terminate FFmpeg if still running
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+        # Check for FFmpeg errors
+        if returncode != 0:
+            raise parse_ffmpeg_error(stderr.decode("utf-8", errors="ignore"), file_path, returncode)
+
+        # int16, and float32 from f32 PCM, are zero-copy views; any other output is a full pass over
+        # the data, which for long segments would stall the event loop
+        zero_copy = output_dtype == "int16" or (output_dtype == "float32" and pcm_dtype == np.float32)
+        if not zero_copy and len(raw_buf) >= _ASYNC_CONVERT_MIN_BYTES:
+            return await asyncio.to_thread(_pcm_to_output, raw_buf, output_dtype, pcm_dtype)
+        return _pcm_to_output(raw_buf, output_dtype, pcm_dtype)
+
+    @staticmethod
+    def stream_to_fd(
+        file_path: str,
+        fd: int,
+        start_ms: Optional[int] = None,
+        duration_ms: Optional[int] = None,
+    ) -> int:
+        """
+        Decode audio and write the raw PCM directly to a file descriptor.
+
+        Intended for pipelines that forward audio to a file, socket or another process
+        without inspecting it in Python. On Linux the data is moved from FFmpeg's pipe
+        with splice(), so it never passes through a userspace buffer. Elsewhere (or if
+        fd does not support splice) it falls back to a read/write loop over one buffer.
+
+        The output is 16-bit signed little-endian PCM, 16kHz mono (the same samples
+        that stream() and read() convert to float32), without any container header.
+
+        Args:
+            file_path: Path to input audio/video file (supports all FFmpeg formats)
+            fd: Writable file descriptor receiving the PCM bytes. It is not closed.
+            start_ms: Start position in milliseconds. None means from file beginning.
+            duration_ms: Total duration to write in milliseconds. None means until end of file.
+
+        Returns:
+            int: Total number of PCM bytes written to fd.
+
+        Raises:
+            TypeError: If parameter types are invalid.
+            ValueError: If file_path is empty or parameter values are invalid (after auto-correction):
+                - start_ms < 0 (auto-corrected to None)
+                - duration_ms <= 0 (auto-corrected to None)
+            FFmpegNotFoundError: If FFmpeg executable is not found in PATH.
+            FileNotFoundError: If the input file does not exist.
+            PermissionError: If file access is denied.
+            UnsupportedFormatError: If file format is not supported or corrupted.
+            FFmpegAudioError: For other FFmpeg processing errors.
+            OSError: If writing to fd fails.
+        """
+        # Validate parameter types
+        if not isinstance(file_path, str) or not file_path.strip():
+            raise ValueError(f"file_path must be a non-empty string, got: {file_path!r}")
+
+        if not isinstance(fd, int):
+            raise TypeError(f"fd must be an int, got: {type(fd).__name__}")
+
+        # Validate and auto-correct time range
+        start_ms, duration_ms = _validate_time_range(start_ms, duration_ms)
+
+        # Build FFmpeg command and launch subprocess
+        cmd = FFmpegAudio._build_command(file_path, start_ms, duration_ms)
+        process = _spawn_ffmpeg(cmd)
+
+        # Drain stderr concurrently, so FFmpeg never blocks on a full stderr pipe
+        stderr_drain = _StderrDrain(process.stderr)
+
+        total_bytes = 0
+        try:
+            stdout_fd = process.stdout.fileno()
+
+            # Zero-copy path: move pages from FFmpeg's pipe straight into fd (Linux only)
+            use_splice = hasattr(os, "splice")
+            while use_splice:
                 try:
-                    process.wait(timeout=1)
-                except Exception:
-                    pass
-
-                # Final error check: catch any errors that occurred during cleanup
-                # This provides additional robustness beyond communicate() error handling
-                if process.returncode is not None and process.returncode != 0:
-                    try:
-                        stderr_output = process.stderr.read().decode("utf-8", errors="ignore")
-                    except Exception:
-                        stderr_output = ""
-                    raise parse_ffmpeg_error(stderr_output, file_path, process.returncode)
+                    n = os.splice(stdout_fd, fd, _PIPE_SIZE, flags=os.SPLICE_F_MOVE)
+                except OSError as e:
+                    # fd does not support splice (e.g. opened with O_APPEND), fall back before any data moved
+                    if e.errno == errno.EINVAL and total_bytes == 0:
+                        use_splice = False
+                        continue
+                    raise
+                if not n:
+                    break
+                total_bytes += n
+
+            if not use_splice:
+                # Portable path: read into one reusable buffer and write it out
+                buf = bytearray(_PIPE_SIZE)
+                buf_view = memoryview(buf)
+                while True:
+                    n = process.stdout.readinto(buf_view)
+                    if not n:
+                        break
+                    chunk = buf_view[:n]
+                    while chunk:
+                        written = os.write(fd, chunk)
+                        chunk = chunk[written:]
+                    total_bytes += n
+
+            # EOF reached, check FFmpeg exit status
+            if process.wait() != 0:
+                raise parse_ffmpeg_error(stderr_drain.text(), file_path, process.returncode)
+
+            return total_bytes
+
+        finally:
+            # Ensure subprocess is properly cleaned up
+            _reap_ffmpeg(process)
+            stderr_drain.text()
+            _close_pipes(process)
+
+
+class FFmpegAudioSession:
+    """
+    Read many segments of one file through a single long-lived FFmpeg process.
+
+    FFmpegAudio.read() launches FFmpeg and probes the container for every segment,
+    which dominates when extracting many short segments (e.g. per-subtitle slices).
+    A session keeps one decoder running and serves each read by skipping forward in
+    its output. A backward request (or a jump further than _SESSION_MAX_SKIP_SEC)
+    restarts FFmpeg at the new position, so any order works, but reads in increasing
+    start order are the cheapest.
+
+    Not thread-safe: use one session per thread.
+
+    Example:
+        with FFmpegAudioSession("audio.mp3") as session:
+            for start_ms, end_ms in segments:
+                audio = session.read(start_ms, end_ms - start_ms)
+    """
+
+    def __init__(self, file_path: str, fast_start: bool = False):
+        """
+        Create a session; FFmpeg is started by the first read().
+
+        Args:
+            file_path: Path to audio/video file (supports all FFmpeg formats)
+            fast_start: Minimal input probing for every FFmpeg launch, see FFmpegAudio.read().
+
+        Raises:
+            TypeError: If fast_start is not a bool.
+            ValueError: If file_path is not a non-empty string.
+        """
+        if not isinstance(file_path, str) or not file_path.strip():
+            raise ValueError(f"file_path must be a non-empty string, got: {file_path!r}")
+
+        if not isinstance(fast_start, bool):
+            raise TypeError(f"fast_start must be a bool, got: {type(fast_start).__name__}")
+
+        self.file_path = file_path
+        self._fast_start = fast_start
+        self._process: Optional[subprocess.Popen] = None
+        self._stderr_drain: Optional[_StderrDrain] = None
+        # Sample position of the next sample on FFmpeg's stdout
+        self._cursor = 0
+        self._scratch: Optional[memoryview] = None
+        # 16kHz mono PCM WAV: every read is served directly from the file, no process needed
+        self._is_pcm16_wav = _pcm16_wav_range(file_path, None, None) is not None
+
+    def __enter__(self) -> "FFmpegAudioSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def read(
+        self,
+        start_ms: Optional[int] = None,
+        duration_ms: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+        output_dtype: Literal["float32", "int16", "bytes"] = "float32",
+    ) -> Union[np.ndarray, bytes]:
+        """
+        Read one segment, with the same arguments and result as FFmpegAudio.read().
+
+        Args:
+            start_ms: Start position in milliseconds. None means from beginning.
+            duration_ms: Segment duration in milliseconds. None means read until end of file
+                (the next read then restarts FFmpeg).
+            timeout_ms: Maximum time for this read in milliseconds. None (default) means 300000ms
+                (configurable via FFMPEG_TIMEOUT_MS env var). If <= 0, uses default timeout with a warning.
+            output_dtype: "float32" (default), "int16" or "bytes", see FFmpegAudio.read().
+
+        Returns:
+            np.ndarray or bytes: Segment audio, see FFmpegAudio.read(). Shorter than requested
+            (possibly empty) if the segment runs past the end of the file.
+
+        Raises:
+            Same exceptions as FFmpegAudio.read().
+        """
+        # Validate parameter types, resolve default and auto-correct invalid timeout
+        timeout_ms = _resolve_timeout_ms(timeout_ms)
+
+        if output_dtype not in _OUTPUT_DTYPES:
+            raise ValueError(f"output_dtype must be one of {_OUTPUT_DTYPES}, got: {output_dtype!r}")
+
+        # Validate and auto-correct time range
+        start_ms, duration_ms = _validate_time_range(start_ms, duration_ms)
+
+        if self._is_pcm16_wav:
+            return FFmpegAudio._read_unchecked(self.file_path, start_ms, duration_ms, timeout_ms, output_dtype, "s16", False, "default")
+
+        start_sample = int(((start_ms or 0) / 1000.0) * FFmpegAudio.SAMPLE_RATE)
+        expected_bytes = None
+        if duration_ms is not None:
+            expected_bytes = int((duration_ms / 1000.0) * FFmpegAudio.SAMPLE_RATE) * 2
+
+        # Continue the running decoder if the segment lies ahead of it, otherwise (re)start at the segment
+        skip_samples = start_sample - self._cursor
+        if self._process is None or skip_samples < 0 or skip_samples > _SESSION_MAX_SKIP_SEC * FFmpegAudio.SAMPLE_RATE:
+            self._start(start_ms, start_sample)
+            skip_samples = 0
+        process = self._process
+
+        # Kill FFmpeg if this read runs past the timeout
+        watchdog, timed_out = _start_watchdog(process, timeout_ms)
+
+        try:
+            self._discard(skip_samples * 2)
+            raw_buf = _read_pcm(process.stdout, expected_bytes, expected_bytes or 0, self._get_scratch())
+        except BaseException:
+            self._stop()
+            raise
+        finally:
+            # cancel() cannot stop a timer that already fired: wait for it to finish, so it
+            # cannot kill FFmpeg after timed_out was checked below
+            watchdog.cancel()
+            watchdog.join()
+
+        if timed_out.is_set():
+            # The watchdog killed FFmpeg. Only a timeout if that cut the segment short: the timer
+            # may also fire just after the segment was read completely
+            cut_short = (expected_bytes is None or len(raw_buf) < expected_bytes) and process.wait() != 0
+            self._stop()
+            if cut_short:
+                raise FFmpegAudioError(f"FFmpeg timeout while processing {self.file_path}", file_path=self.file_path)
+            return _pcm_to_output(raw_buf, output_dtype, np.dtype(np.int16))
+
+        self._cursor = start_sample + len(raw_buf) // 2
+
+        # Fewer bytes than requested means EOF: FFmpeg is exiting, check how it ended
+        if expected_bytes is None or len(raw_buf) < expected_bytes:
+            returncode = process.wait()
+            if returncode != 0:
+                error = parse_ffmpeg_error(self._stderr_drain.text(), self.file_path, returncode)
+                self._stop()
+                raise error
+
+        return _pcm_to_output(raw_buf, output_dtype, np.dtype(np.int16))
+
+    def close(self) -> None:
+        """Stop the FFmpeg process, if any. The session can still be used; the next read() restarts FFmpeg."""
+        self._stop()
+
+    def _start(self, start_ms: Optional[int], start_sample: int) -> None:
+        """(Re)launch FFmpeg decoding from start_ms to the end of the file"""
+        self._stop()
+        cmd = FFmpegAudio._build_command(self.file_path, start_ms, None, fast_start=self._fast_start)
+        self._process = _spawn_ffmpeg(cmd)
+        self._stderr_drain = _StderrDrain(self._process.stderr)
+        self._cursor = start_sample
+
+    def _stop(self) -> None:
+        """Terminate and clean up the current FFmpeg process"""
+        if self._process is None:
+            return
+        _reap_ffmpeg(self._process)
+        self._stderr_drain.text()
+        _close_pipes(self._process)
+        self._process = None
+        self._stderr_drain = None
+
+    def _get_scratch(self) -> memoryview:
+        """Pipe-sized scratch buffer, allocated on first use and kept for the life of the session"""
+        if self._scratch is None:
+            self._scratch = memoryview(bytearray(_PIPE_SIZE))
+        return self._scratch
+
+    def _discard(self, n_bytes: int) -> None:
+        """Read and drop n_bytes of FFmpeg output (or until EOF)"""
+        if not n_bytes:
+            return
+        scratch = self._get_scratch()
+        while n_bytes > 0:
+            n = self._process.stdout.readinto(scratch[: min(n_bytes, _PIPE_SIZE)])
+            if not n:
+                break
+            n_bytes -= n